@@ -15,13 +15,10 @@
 
 ########  Set-up  #############################################################
 
-# Some helper functions to pull out the least and
-# most-significant bytes of a 2-byte address
-def lsb(word):
-    return(word & 0x00FF)
-
-def msb(word):
-    return(word >> 8)
+# The struct module packs 2-byte addresses into the little-endian
+# (least-significant byte first) layout the 6502 expects
+import struct
+from pathlib import Path
 
 
 # Rom size in bytes (valid values are 2k or 4k)
@@ -29,12 +26,15 @@ rom_size = 2 * 1024
 pad_byte = 0
 file_name = 'rainbows.bin'
 
+# Address of the first byte of the ROM. The Atari "sees" the ROM in several
+# mirrored address ranges, but we'll think of it as living in the top-most
+# one (0xF800-0xFFFF for 2k carts and 0xF000-0xFFFF for 4k). Every absolute
+# address below is just an offset from here.
+rom_base = 0x10000 - rom_size
+
 # The "reset vector" is the address of where we want code execution to begin.
-# We'll make it the first byte of the file, from the point of view of the
-# Atari's internal addressing scheme, which "sees" the ROM in several mirrored
-# address ranges. Here, we'll think of the ROM as living in the top-most
-# mirrored range (0xF800-0xFFFF for 2k carts and 0xF000-0xFFFF for 4k)
-reset_vector = 0xFFFF - rom_size + 1
+# We'll make it the first byte of the file
+reset_vector = rom_base
 
 
 
@@ -48,84 +48,87 @@ reset_vector = 0xFFFF - rom_size + 1
 # http://www.6502.org/tutorials/6502opcodes.html
 # for all the various hex values we could use here
 
-# We'll define each section of code as a separate bytearray, for flexibility
-# and reusability, and to make absolute jump addressing easier to calculate.
+# We'll define each section of code as a separate bytes literal, for
+# flexibility and reusability, and to make absolute jump addressing easier
+# to calculate. Adjacent literals are joined together by Python itself, so
+# each chunk is stored as one ready-made constant.
 
 
 # Initialization routine
-init_tia = bytearray([
-    
+init_tia = (
+
     # Set up 6507
-    0x78,               # SEI           ; Disable interrupts
-    0xD8,               # CLD           ; Disable BCD math mode
-    0xA2, 0xFF,         # LDX #$FF
-    0x9A,               # TXS           ; Set stack pointer to top of RAM
-    0xA9, 0x00,         # LDA #0        ; Set A to zero
-    0xE8,               # INX           ; This effectively sets X to zero
-    0xA8,               # TAY           ; Zero out Y too
-    
-    # Clear out TIA registers (this uses A and X, but leaves them at zero)    
-    0x95, 0x00,         # STA $00,X     ; Write A's zero to address X
-    0xCA,               # DEX           ; Note: Wraps to $FF on first decrement
-    0xD0, 0xFB          # BNE -5        ; (to STA $00,X)
+    b'\x78'             # SEI           ; Disable interrupts
+    b'\xD8'             # CLD           ; Disable BCD math mode
+    b'\xA2\xFF'         # LDX #$FF
+    b'\x9A'             # TXS           ; Set stack pointer to top of RAM
+    b'\xA9\x00'         # LDA #0        ; Set A to zero
+    b'\xE8'             # INX           ; This effectively sets X to zero
+    b'\xA8'             # TAY           ; Zero out Y too
 
-    ])
+    # Clear out TIA registers (this uses A and X, but leaves them at zero)
+    b'\x95\x00'         # STA $00,X     ; Write A's zero to address X
+    b'\xCA'             # DEX           ; Note: Wraps to $FF on first decrement
+    b'\xD0\xFB'         # BNE -5        ; (to STA $00,X)
+
+    )
 
 
 
 # Vertical blank routine: Signal the television beam to head back up to the
 # top and start a new frame. Keep beam off until we're sure we're in the
 # visible portion of the screen.
-vblank = bytearray([
-    
+vblank = (
+
     # Vertical sync
-    0xA9, 0x02,         # LDA #2
-    0x85, 0x01,         # STA VBLANK    ; Turn on vertical blanking
-    0x85, 0x00,         # STA VSYNC     ; Turn on vertical sync
-    0x85, 0x02,         # STA WSYNC     ; Three lines of vsync signal
-    0x85, 0x02,         # STA WYSNC
-    0x85, 0x02,         # STA WSYNC
-    0xA9, 0x00,         # LDA #0
-    0x85, 0x00,         # STA VSYNC     ; Turn off vertical sync
-    
+    b'\xA9\x02'         # LDA #2
+    b'\x85\x01'         # STA VBLANK    ; Turn on vertical blanking
+    b'\x85\x00'         # STA VSYNC     ; Turn on vertical sync
+    b'\x85\x02'         # STA WSYNC     ; Three lines of vsync signal
+    b'\x85\x02'         # STA WYSNC
+    b'\x85\x02'         # STA WSYNC
+    b'\xA9\x00'         # LDA #0
+    b'\x85\x00'         # STA VSYNC     ; Turn off vertical sync
+
     # Remainder of vertical blanking period (37 lines)
-    0xA2, 0x25,         # LDX #37
-    
-    0x85, 0x02,         # STA WSYNC
-    0xCA,               # DEX
-    0xD0, 0xFB,         # BNE -5        ; (to STA WSYNC)
-    
-    0x85, 0x01          # STA VBLANK    ; Turn off vertical blanking
-    
-    ])
-
-
-    
+    b'\xA2\x25'         # LDX #37
+
+    b'\x85\x02'         # STA WSYNC
+    b'\xCA'             # DEX
+    b'\xD0\xFB'         # BNE -5        ; (to STA WSYNC)
+
+    b'\x85\x01'         # STA VBLANK    ; Turn off vertical blanking
+
+    )
+
+
+
 # Display the visible area of the frame (192 lines for NTSC,). We change
 # the background color every scanline, starting with whatever color is in
 # memory location $80 for the top line. Since the least-significant bit is
 # ignored for color values, we have to increment it twice to actually get
 # a different color.
-viz_area = bytearray([
-    
-    0xA2, 0xC0,         # LDX #192      ; Line count. Use 0xF2 (242) for PAL
-    0xA4, 0x80,         # LDY $80       ; Get starting color for this frame
-    
-    0x84, 0x09,         # STY COLUBK    ; Set the background color
-    0xC8,               # INY           ; Increment the color value
-    0xC8,               # INY           ; ...twice
-    0x85, 0x02,         # STA WSYNC     ; Wait for scanline to end
-    0xCA,               # DEX           ; Decrement the line count
-    0xD0, 0xF7          # BNE -9        ; (to STY COLUBK)
-    
-    ])
+viz_area = (
+
+    b'\xA2\xC0'         # LDX #192      ; Line count. Use 0xF2 (242) for PAL
+    b'\xA4\x80'         # LDY $80       ; Get starting color for this frame
+
+    b'\x84\x09'         # STY COLUBK    ; Set the background color
+    b'\xC8'             # INY           ; Increment the color value
+    b'\xC8'             # INY           ; ...twice
+    b'\x85\x02'         # STA WSYNC     ; Wait for scanline to end
+    b'\xCA'             # DEX           ; Decrement the line count
+    b'\xD0\xF7'         # BNE -9        ; (to STY COLUBK)
+
+    )
 
 
 
-# Calculate the address of the entry point of main loop, which is five
-# bytes into the vblank code chunk (at the first STA VSYNC). We'll use
-# this address for the JMP at the end of the following code chunk...
-looptop = 0xFFFF - rom_size + len(init_tia) + 5
+# Calculate the address of the entry point of main loop, which is the
+# fifth byte of the vblank code chunk (at the first STA VSYNC), four bytes
+# past its start. We'll use this address for the JMP at the end of the
+# following code chunk...
+looptop = rom_base + len(init_tia) + 4
 
 
 # Overscan routine: Turn beam off for the final scanlines, ensuring that
@@ -134,30 +137,30 @@ looptop = 0xFFFF - rom_size + len(init_tia) + 5
 # needed frame-to-frame updates. Here, we'll just change the value held in
 # the memory address used to keep track of the starting color for each
 # frame, giving us the famous "Atari Rainbow Waterfall" effect.
-overscan = bytearray([
-    
+overscan = (
+
     # Blank area at bottom of frame (30 total scanlines)
-    0xA9, 0x02,         # LDA #2
-    0x85, 0x01,         # STA VBLANK
-    0xA2, 0x1C,         # LDX #28       ; Waste time for 28 scanlines
-    
-    0x85, 0x02,         # STA WSYNC
-    0xCA,               # DEX
-    0xD0, 0xFB,         # BNE -5        ; (to STA WSYNC)
-    
+    b'\xA9\x02'         # LDA #2
+    b'\x85\x01'         # STA VBLANK
+    b'\xA2\x1C'         # LDX #28       ; Waste time for 28 scanlines
+
+    b'\x85\x02'         # STA WSYNC
+    b'\xCA'             # DEX
+    b'\xD0\xFB'         # BNE -5        ; (to STA WSYNC)
+
     # During the last scanline, adjust starting color
-    0xA5, 0x80,         # LDA $80
-    0x38,               # SEC           ; Always set the carry flag before SBC!
-    0xE9, 0x04,         # SBC #2        ; Change this value to adjust "speed"
-    0x85, 0x02,         # STA WSYNC     ; Finish 29th line
-    0x85, 0x80,         # STA $80
-    0xA9, 0x02,         # LDA #2        ; In prep for the VSYNC at top of loop
-    0x85, 0x02,         # STA WSYNC     ; Wait for 30th line to finish
-    
-    0x4C, lsb(looptop), # JMP to start of main loop. (Note that the 6502 family
-          msb(looptop)  # uses "little-endian" addressing, with the lsb first.)
+    b'\xA5\x80'         # LDA $80
+    b'\x38'             # SEC           ; Always set the carry flag before SBC!
+    b'\xE9\x04'         # SBC #2        ; Change this value to adjust "speed"
+    b'\x85\x02'         # STA WSYNC     ; Finish 29th line
+    b'\x85\x80'         # STA $80
+    b'\xA9\x02'         # LDA #2        ; In prep for the VSYNC at top of loop
+    b'\x85\x02'         # STA WSYNC     ; Wait for 30th line to finish
+
+    b'\x4C'             # JMP to start of main loop. (Note that the 6502 family
+                        # uses "little-endian" addressing, with the lsb first.)
 
-    ])
+    ) + struct.pack('<H', looptop)
 
 
 
@@ -168,28 +171,24 @@ overscan = bytearray([
 ###############################################################################
 
 # Just stitch the code chunks together...
-rom = init_tia + vblank + viz_area + overscan
-code_length = len(rom)
+code = init_tia + vblank + viz_area + overscan
+code_length = len(code)
 
-# Fill out the unused portions of the rom
-num_pad_bytes = rom_size - code_length
-rom = rom + bytearray([pad_byte] * num_pad_bytes)
+# ...and fill out the unused portions of the rom with the pad byte
+rom = bytearray(code.ljust(rom_size, bytes([pad_byte])))
 
 # Poke the reset vector into the 4th-highest and 3rd-highest bytes, where the
 # 6502 microprocessor family is designed to look for it on start-up
-rom[rom_size - 4] = lsb(reset_vector)
-rom[rom_size - 3] = msb(reset_vector)
+struct.pack_into('<H', rom, rom_size - 4, reset_vector)
 
 # Output the binary
-with open(file_name, 'wb') as out_file:
-    out_file.write(rom)
+Path(file_name).write_bytes(rom)
 
 # Status report
-print()
-print('File "' + file_name + '" complete')
-print(str(code_length) + ' bytes of program code')
-print(str(len(rom)) + ' total bytes on cartridge')
-print('Reset vector: ' + f"0x{reset_vector:X}")
-print()
+print(f'\n'
+      f'File "{file_name}" complete\n'
+      f'{code_length} bytes of program code\n'
+      f'{rom_size} total bytes on cartridge\n'
+      f'Reset vector: 0x{reset_vector:X}\n')
 
 